@@ -6,13 +6,12 @@ Provides a user-friendly web interface for PDF processing
 
 from flask import Flask, render_template, request, jsonify, send_file
 import os
-import json
 import time
 from pathlib import Path
 from werkzeug.utils import secure_filename
 from src.structure_extractor import StructureExtractor
 from src.persona_analyzer import PersonaAnalyzer
-from src.utils import setup_logging
+from src.utils import setup_logging, write_json
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
@@ -70,8 +69,7 @@ def upload_files():
                 
                 # Save result
                 output_file = Path(app.config['OUTPUT_FOLDER']) / f"{pdf_file.stem}_structure.json"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
+                write_json(result, output_file)
                 
                 results.append({
                     'filename': pdf_file.name,
@@ -98,8 +96,7 @@ def upload_files():
             
             # Save result
             output_file = Path(app.config['OUTPUT_FOLDER']) / "persona_analysis.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            write_json(result, output_file)
             
             results.append({
                 'processing_time': f"{elapsed:.2f}s",
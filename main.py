@@ -1,8 +1,5 @@
 from pathlib import Path
-import json
-import time
-from src.persona_analyzer import PersonaAnalyzer
-from src.utils import setup_logging, load_json_safely
+from src.utils import setup_logging, load_json_safely, write_json
 
 def main():
     setup_logging()
@@ -23,16 +20,16 @@ def main():
             "persona": "Default Persona",
             "job_to_be_done": "Default Job"
         }
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(default_config, f, indent=2)
+        write_json(default_config, config_path)
         print("⚠️ persona_config.json not found. Created a default config.")
 
     print("🔍 Running Persona Analyzer (Round 1B)...")
+    # Deferred so runs with no input skip loading torch and the embedding model
+    from src.persona_analyzer import PersonaAnalyzer
     config = load_json_safely(config_path)
     analyzer = PersonaAnalyzer()
     result = analyzer.analyze_documents(pdf_files, config)
-    with open(output_dir / "persona_analysis.json", "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2)
+    write_json(result, output_dir / "persona_analysis.json")
     print("✅ Round 1B complete. Check output/persona_analysis.json")
 
 if __name__ == "__main__":
@@ -7,6 +7,17 @@ import re
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
+# Heading patterns checked against every text span
+_HEADING_PATTERNS = tuple(re.compile(p) for p in (
+    r'^\d+\.?\s+[A-Z]',  # Numbered headings
+    r'^[A-Z][A-Z\s]+$',  # ALL CAPS
+    r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$',  # Title Case
+    r'^\d+\.\d+\.?\s+',  # Numbered subsections
+))
+_H1_NUMBER_RE = re.compile(r'^\d+\.?\s+')
+_H2_NUMBER_RE = re.compile(r'^\d+\.\d+\.?\s+')
+_H3_NUMBER_RE = re.compile(r'^\d+\.\d+\.\d+\.?\s+')
+
 class PDFProcessor:
     """Base class for PDF processing operations"""
     
@@ -177,16 +188,8 @@ class PDFProcessor:
             return False
         
         # Check for heading patterns
-        heading_patterns = [
-            r'^\d+\.?\s+[A-Z]',  # Numbered headings
-            r'^[A-Z][A-Z\s]+$',  # ALL CAPS
-            r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$',  # Title Case
-            r'^\d+\.\d+\.?\s+',  # Numbered subsections
-        ]
-        
-        for pattern in heading_patterns:
-            if re.match(pattern, text):
-                return True
+        if any(p.match(text) for p in _HEADING_PATTERNS):
+            return True
         
         # Check formatting
         size = block.get("size", 0)
@@ -208,11 +211,11 @@ class PDFProcessor:
         text = block["text"].strip()
         
         # Check for numbered patterns
-        if re.match(r'^\d+\.?\s+', text):
+        if _H1_NUMBER_RE.match(text):
             return "H1"
-        elif re.match(r'^\d+\.\d+\.?\s+', text):
+        elif _H2_NUMBER_RE.match(text):
             return "H2"
-        elif re.match(r'^\d+\.\d+\.\d+\.?\s+', text):
+        elif _H3_NUMBER_RE.match(text):
             return "H3"
         
         # Font size based classification
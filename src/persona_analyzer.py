@@ -1,18 +1,54 @@
-import json
+import heapq
+import os
 import time
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from pathlib import Path
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
 from .pdf_processor import PDFProcessor
-from .structure_extractor import StructureExtractor
-from sentence_transformers import SentenceTransformer, util
-import torch
+
+_HEADING_PATTERNS = tuple(re.compile(p) for p in (
+    r'^\d+\.?\s+[A-Z]',
+    r'^[A-Z][A-Z\s]+$',
+    r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$',
+))
+
+
+def _extract_pdf_sections(pdf: Path) -> List[Dict[str, Any]]:
+    """Extract enriched sections from a single PDF (picklable so it can run in a process pool)"""
+    processor = PDFProcessor()
+    if not processor.load_pdf(pdf):
+        return []
+    sections = processor.extract_sections_by_formatting()
+    enriched = []
+    seen = set()
+    page_lines = {}
+    for sec in sections:
+        # Repeated headings (running headers, TOC entries) are only ranked once
+        if sec["text"] in seen:
+            continue
+        seen.add(sec["text"])
+        # Only pages that carry a section are read, each of them once
+        if sec["page"] not in page_lines:
+            page_text = processor.extract_page_text(sec["page"] - 1)
+            page_lines[sec["page"]] = PersonaAnalyzer._split_page(page_text)
+        content = PersonaAnalyzer._extract_section_content(page_lines[sec["page"]], sec["text"])
+        enriched.append({
+            "document": pdf.name,
+            "section_title": sec["text"],
+            "page": sec["page"],
+            "combined": f"{sec['text']} {content}".strip()
+        })
+    processor.close()
+    return enriched
+
 
 class PersonaAnalyzer:
     def __init__(self):
-        self.processor = PDFProcessor()
-        self.extractor = StructureExtractor()
+        # Imported here so spawned PDF workers don't re-import torch; forked ones inherit it
+        from sentence_transformers import SentenceTransformer
+
         self.embedder = SentenceTransformer('paraphrase-MiniLM-L6-v2')
         self.persona = ""
         self.job_to_be_done = ""
@@ -45,68 +81,73 @@ class PersonaAnalyzer:
         }
 
     def _extract_document_contents(self, pdf_files: List[Path]) -> List[Dict[str, Any]]:
+        if len(pdf_files) <= 1:
+            return [s for pdf in pdf_files for s in _extract_pdf_sections(pdf)]
+
+        # PDF parsing holds the GIL, so spread files across processes.
+        # Small batches go one file per task; larger ones are chunked to
+        # keep the workers streaming without per-file scheduling overhead.
+        workers = min(os.cpu_count() or 1, len(pdf_files))
+        chunksize = max(1, len(pdf_files) // (workers * 4))
         docs = []
-        for pdf in pdf_files:
-            if not self.processor.load_pdf(pdf):
-                continue
-            structure = self.extractor.extract_structure(pdf)
-            full_text = self.processor.extract_all_text()
-            sections = self.processor.extract_sections_by_formatting()
-            enriched = []
-            for sec in sections:
-                page_num = sec["page"] - 1
-                if page_num < self.processor.page_count:
-                    page_text = self.processor.extract_page_text(page_num)
-                    content = self._extract_section_content(page_text, sec["text"])
-                    enriched.append({
-                        "document": pdf.name,
-                        "section_title": sec["text"],
-                        "page": sec["page"],
-                        "combined": f"{sec['text']} {content}".strip()
-                    })
-            docs.extend(enriched)
-            self.processor.close()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for sections in executor.map(_extract_pdf_sections, pdf_files, chunksize=chunksize):
+                docs.extend(sections)
         return docs
 
-    def _extract_section_content(self, page_text: str, section_title: str) -> str:
+    @staticmethod
+    def _split_page(page_text: str) -> Tuple[str, List[int], List[str], List[bool]]:
+        """Index a page's line offsets, lowercased lines and heading flags, shared by its sections"""
         lines = page_text.split('\n')
-        start_line = -1
-        for i, line in enumerate(lines):
-            if section_title.lower() in line.lower():
-                start_line = i
-                break
+        line_starts = list(accumulate((len(line) + 1 for line in lines), initial=0))
+        lines_lc = [line.lower() for line in lines]
+        is_heading = [PersonaAnalyzer._looks_like_heading(line.strip()) for line in lines]
+        return page_text, line_starts, lines_lc, is_heading
+
+    @staticmethod
+    def _extract_section_content(page_lines: Tuple[str, List[int], List[str], List[bool]], section_title: str) -> str:
+        page_text, line_starts, lines_lc, is_heading = page_lines
+        title_lc = section_title.lower()
+        start_line = next((i for i, line in enumerate(lines_lc) if title_lc in line), -1)
         if start_line == -1:
             return ""
-        end_line = len(lines)
-        for i in range(start_line + 1, len(lines)):
-            if self._looks_like_heading(lines[i].strip()):
-                end_line = i
-                break
-        return '\n'.join(lines[start_line + 1:end_line]).strip()
-
-    def _looks_like_heading(self, text: str) -> bool:
+        end_line = next((i for i in range(start_line + 1, len(lines_lc)) if is_heading[i]), len(lines_lc))
+        # Slice the lines out of the page text directly rather than re-joining them
+        return page_text[line_starts[start_line + 1]:line_starts[end_line]].strip()
+
+    @staticmethod
+    def _looks_like_heading(text: str) -> bool:
         if len(text) < 3 or len(text) > 150:
             return False
-        patterns = [r'^\d+\.?\s+[A-Z]', r'^[A-Z][A-Z\s]+$', r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$']
-        return any(re.match(p, text) for p in patterns)
+        return any(p.match(text) for p in _HEADING_PATTERNS)
 
     def _extract_relevant_sections(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        from sentence_transformers import util
+
         query = f"{self.persona}. {self.job_to_be_done}"
         q_embed = self.embedder.encode(query, convert_to_tensor=True)
+        # Workers only dedup within one PDF; the same file can be passed twice
         seen = set()
-        scored = []
+        unique = []
         for s in sections:
             key = (s["document"], s["section_title"])
             if key in seen:
                 continue
             seen.add(key)
-            sec_embed = self.embedder.encode(s["combined"], convert_to_tensor=True)
-            sim = util.pytorch_cos_sim(q_embed, sec_embed).item()
+            unique.append(s)
+        sections = unique
+        if not sections:
+            return []
+
+        # Encode all sections in one batch and score them against the query at once
+        sec_embeds = self.embedder.encode([s["combined"] for s in sections], convert_to_tensor=True)
+        sims = util.pytorch_cos_sim(q_embed, sec_embeds)[0].tolist()
+        scored = []
+        for s, sim in zip(sections, sims):
             if sim > 0.2:
                 s["score"] = sim
                 scored.append(s)
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        return scored[:5]  # Limit to top 5 most relevant
+        return heapq.nlargest(5, scored, key=lambda x: x["score"])  # Limit to top 5 most relevant
 
     def _refine_sections_content(self, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         refined = []
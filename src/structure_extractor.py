@@ -383,6 +383,21 @@ from typing import Dict, List, Any
 from pathlib import Path
 from .pdf_processor import PDFProcessor
 
+_TITLE_SKIP_RE = re.compile(r'^(page|abstract|introduction|table of contents|www\.|http)')
+_SECTION_SKIP_RE = re.compile(r'^(page|figure|table|ref|www\.|http|\d{1,2} [A-Z]{3,})')
+# Whole lines ending in one or more colons, e.g. form labels like "Name:"
+_LABEL_RE = re.compile(r'^[^\S\n]*(.*?):+[^\S\n]*$', re.MULTILINE)
+
+
+def _compile_terms(terms: List[str]) -> re.Pattern:
+    """Compile a term list into one alternation so a single scan finds any of them"""
+    return re.compile("|".join(re.escape(t) for t in terms))
+
+
+_TITLE_TERMS_RE = _compile_terms(['challenge', 'connecting', 'dots', 'hackathon'])
+_HIGH_IMPORTANCE_RE = _compile_terms(['revision history', 'table of contents', 'acknowledgements', 'introduction', 'overview', 'syllabus'])
+_H1_TERMS_RE = _compile_terms(['overview of', 'introduction to', 'references'])
+
 
 class StructureExtractor:
     """Extracts structured outline from PDF documents"""
@@ -394,7 +409,14 @@ class StructureExtractor:
         if not self.processor.load_pdf(pdf_path):
             return {"title": "Error", "outline": [], "error": "Failed to load PDF"}
 
-        sections = self.processor.extract_sections_by_formatting()
+        structure = self.extract_structure_from_processor(self.processor)
+
+        self.processor.close()
+        return structure
+
+    def extract_structure_from_processor(self, processor: PDFProcessor) -> Dict[str, Any]:
+        """Extract structure from an already loaded PDF; the caller closes it"""
+        sections = processor.extract_sections_by_formatting()
         refined = self._refine_sections(sections)
         outline = [
             {"level": s["level"], "text": s["text"], "page": s["page"]}
@@ -403,28 +425,27 @@ class StructureExtractor:
 
         # fallback if outline is completely empty (e.g., form documents)
         if not outline:
-            first_page_text = self.processor.extract_page_text(0)
+            first_page_text = processor.extract_page_text(0)
             outline = self._fallback_extract_labels(first_page_text)
 
-        title = self._extract_title(outline)
+        title = self._extract_title(processor, outline)
 
-        self.processor.close()
         return {
             "title": title,
             "outline": outline
         }
 
-    def _extract_title(self, outline: List[Dict[str, Any]]) -> str:
-        doc_info = self.processor.get_document_info()
+    def _extract_title(self, processor: PDFProcessor, outline: List[Dict[str, Any]]) -> str:
+        doc_info = processor.get_document_info()
         metadata_title = doc_info.get("title", "").strip()
         if metadata_title and len(metadata_title) > 3:
             return metadata_title
 
-        candidates = self.processor.find_title_candidates()
+        candidates = processor.find_title_candidates()
         if candidates:
             return "  ".join(c[0] for c in candidates[:2])
 
-        first_page_text = self.processor.extract_page_text(0)
+        first_page_text = processor.extract_page_text(0)
         title_from_text = self._extract_title_from_text(first_page_text)
         if title_from_text:
             return title_from_text
@@ -435,13 +456,15 @@ class StructureExtractor:
         return "Untitled Document"
 
     def _extract_title_from_text(self, text: str) -> str:
-        lines = [line.strip() for line in text.split('\n') if 5 < len(line.strip()) < 200]
+        stripped = (line.strip() for line in text.split('\n'))
+        lines = [line for line in stripped if 5 < len(line) < 200]
         candidates = []
         for i, line in enumerate(lines[:15]):
-            if re.match(r'^(page|abstract|introduction|table of contents|www\.|http)', line.lower()):
+            line_lower = line.lower()
+            if _TITLE_SKIP_RE.match(line_lower):
                 continue
             score = 0
-            if any(word in line.lower() for word in ['challenge', 'connecting', 'dots', 'hackathon']):
+            if _TITLE_TERMS_RE.search(line_lower):
                 score += 3
             if i < 5:
                 score += 2
@@ -463,24 +486,22 @@ class StructureExtractor:
             text = sec["text"].strip()
             if text in seen or not (3 <= len(text) <= 150):
                 continue
-            if re.match(r'^(page|figure|table|ref|www\.|http|\d{1,2} [A-Z]{3,})', text.lower()):
+            text_lower = text.lower()
+            if _SECTION_SKIP_RE.match(text_lower):
                 continue
 
-            importance = self._calculate_importance(text)
+            importance = self._calculate_importance(text, text_lower)
             if importance == 0:
                 continue
 
-            level = self._determine_level(text)
+            level = self._determine_level(text, text_lower)
             cleaned.append({"text": text, "page": sec["page"], "level": level})
             seen.add(text)
 
         return cleaned
 
-    def _calculate_importance(self, text: str) -> int:
-        text_lower = text.lower()
-
-        high = ['revision history', 'table of contents', 'acknowledgements', 'introduction', 'overview', 'syllabus']
-        if any(t in text_lower for t in high):
+    def _calculate_importance(self, text: str, text_lower: str) -> int:
+        if _HIGH_IMPORTANCE_RE.search(text_lower):
             return 2
 
         # Support form labels like "Name:", "Age:"
@@ -493,11 +514,9 @@ class StructureExtractor:
 
         return 0
 
-    def _determine_level(self, text: str) -> str:
-        text_lower = text.lower()
-
+    def _determine_level(self, text: str, text_lower: str) -> str:
         # Structured hierarchy for reports
-        if any(k in text_lower for k in ['overview of', 'introduction to', 'references']):
+        if _H1_TERMS_RE.search(text_lower):
             return "H1"
 
         # Form fields like "Name:" → H2
@@ -508,16 +527,8 @@ class StructureExtractor:
         return "H2"
 
     def _fallback_extract_labels(self, text: str) -> List[Dict[str, Any]]:
-        lines = text.split('\n')
-        outline = []
-
-        for line in lines:
-            line = line.strip()
-            if line.endswith(":") and len(line.split()) <= 8:
-                outline.append({
-                    "level": "H2",
-                    "text": line.rstrip(":"),
-                    "page": 1
-                })
-
-        return outline
+        return [
+            {"level": "H2", "text": m.group(1), "page": 1}
+            for m in _LABEL_RE.finditer(text)
+            if len(m.group(0).split()) <= 8
+        ]
@@ -7,6 +7,11 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def setup_logging():
     """Set up logging configuration"""
     logging.basicConfig(
@@ -26,11 +31,20 @@ def load_json_safely(file_path: Path) -> Optional[Dict[str, Any]]:
         print(f"Error loading JSON from {file_path}: {str(e)}")
         return None
 
+def write_json(data: Dict[str, Any], file_path: Path) -> None:
+    """Write JSON to disk, using orjson when it is installed"""
+    if orjson is not None:
+        Path(file_path).write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 def save_json_safely(data: Dict[str, Any], file_path: Path) -> bool:
     """Safely save JSON file with error handling"""
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(data, file_path)
         return True
     except Exception as e:
         print(f"Error saving JSON to {file_path}: {str(e)}")
@@ -48,24 +62,24 @@ def clean_text(text: str) -> str:
     
     return text.strip()
 
+# Common stop words
+_STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was',
+    'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now',
+    'old', 'see', 'two', 'way', 'who', 'boy', 'did', 'its', 'let', 'put', 'say', 'she',
+    'too', 'use', 'with', 'have', 'this', 'will', 'your', 'from', 'they', 'know', 'want',
+    'been', 'good', 'much', 'some', 'time', 'very', 'when', 'come', 'here', 'just', 'like',
+    'long', 'make', 'many', 'over', 'such', 'take', 'than', 'them', 'well', 'were'
+})
+
 def extract_keywords_simple(text: str, min_length: int = 3) -> set:
     """Simple keyword extraction"""
     import re
     
     # Extract words
-    words = re.findall(r'\b[a-zA-Z]{' + str(min_length) + ',}\b', text.lower())
-    
-    # Common stop words
-    stop_words = {
-        'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was',
-        'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now',
-        'old', 'see', 'two', 'way', 'who', 'boy', 'did', 'its', 'let', 'put', 'say', 'she',
-        'too', 'use', 'with', 'have', 'this', 'will', 'your', 'from', 'they', 'know', 'want',
-        'been', 'good', 'much', 'some', 'time', 'very', 'when', 'come', 'here', 'just', 'like',
-        'long', 'make', 'many', 'over', 'such', 'take', 'than', 'them', 'well', 'were'
-    }
+    words = re.findall(r'\b[a-zA-Z]{' + str(min_length) + r',}\b', text.lower())
     
-    keywords = set(word for word in words if word not in stop_words)
+    keywords = set(word for word in words if word not in _STOP_WORDS)
     return keywords
 
 def calculate_text_similarity(text1: str, text2: str) -> float: